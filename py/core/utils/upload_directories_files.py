@@ -1,8 +1,56 @@
 import os
+from collections.abc import Iterator
 from pathlib import Path, PurePath
 
 from shared.abstractions import DocumentType
 
+# File extensions (with a leading dot) for every supported DocumentType
+_DEFAULT_ACCEPTED_EXTS: tuple[str, ...] = tuple(
+    f".{doc_type.value.lower()}" for doc_type in DocumentType
+)
+
+
+def _as_tuple(value) -> tuple[str, ...]:
+    """Return value as a tuple of strings, treating a bare str as a single item."""
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def _walk(
+    dirpath: str,
+    ignore_dirs: frozenset[str] = frozenset(),
+    descend_ignored: bool = False,
+    in_ignored_dir: bool = False,
+):
+    """
+    Recursively yield (os.DirEntry, in_ignored_dir) pairs for the files below dirpath.
+
+    Uses os.scandir so file type checks come from the cached directory entry
+    instead of an extra stat per entry. Subdirectories whose name is in
+    ignore_dirs are not descended into unless descend_ignored is set, in which
+    case files below them are yielded with in_ignored_dir set to True. Like
+    os.walk, symlinked directories are not followed and unreadable
+    directories are skipped.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            ignored = in_ignored_dir or entry.name in ignore_dirs
+            if descend_ignored or not ignored:
+                subdirs.append((entry.path, ignored))
+        elif entry.is_file():
+            yield entry, in_ignored_dir
+
+    for subdir, ignored in subdirs:
+        yield from _walk(subdir, ignore_dirs, descend_ignored, ignored)
+
 
 class RecursiveDirectoryFileScanner:
     """
@@ -44,10 +92,7 @@ class RecursiveDirectoryFileScanner:
         # Convert accepted_exts to proper format
         if accepted_exts is None:
             # Get file extensions from DocumentType enum
-            self.accepted_exts = []
-            for doc_type in DocumentType:
-                # Add the extension with a leading dot
-                self.accepted_exts.append(f".{doc_type.value.lower()}")
+            self.accepted_exts = list(_DEFAULT_ACCEPTED_EXTS)
         else:
             self.accepted_exts = accepted_exts
 
@@ -67,78 +112,81 @@ class RecursiveDirectoryFileScanner:
         # This will ignore the ./dir/dir/file.ext path declared in the list[str] | str.
         self.ignore_file_paths = ignore_file_paths or []
 
-    def scan(self) -> list[str] | None:
+    def scan(self) -> Iterator[str]:
         """
-        Scan the directory and return a list of files that match the criteria.
+        Scan the directory and yield the files that match the criteria.
 
-        Returns:
-            list[str] or None: A list of file paths that match the criteria, None if no matches
+        Files are yielded as they are found, so callers can start processing
+        them before the whole tree has been walked.
+
+        Yields:
+            str: File paths that match the criteria
         """
-        matched_files = []
+        root_dir = os.fspath(self.root_dir)
+
+        # Build the lookup sets and lowercased extension tuples once per scan
+        ignore_dirs = frozenset(_as_tuple(self.ignore_dirs))
+        ignore_filenames = frozenset(_as_tuple(self.ignore_filenames))
+        include_filenames = frozenset(
+            _as_tuple(self.include_file_at_specific_path)
+        )
+        accepted_exts_lower = tuple(
+            ext.lower() for ext in _as_tuple(self.accepted_exts)
+        )
+        ignore_exts_lower = tuple(
+            ext.lower() for ext in _as_tuple(self.ignore_exts)
+        )
+
+        # Paths yielded by _walk all start with root_dir plus a separator, so
+        # relative paths can be sliced off instead of computed with relpath
+        root_prefix_len = len(os.path.join(root_dir, ""))
 
         # Normalize the ignore file paths for consistent comparison
-        normalized_ignore_paths = [
-            os.path.normpath(ignore) for ignore in self.ignore_file_paths
-        ]
+        normalized_ignore_paths = frozenset(
+            os.path.normpath(ignore)
+            for ignore in _as_tuple(self.ignore_file_paths)
+        )
 
-        # Special case: If include_file_at_specific_path is specified, we need to do a full scan first
-        if self.include_file_at_specific_path:
-            # Do a full scan to find special files, even in ignored directories
-            for root, _, files in os.walk(self.root_dir):
-                for filename in files:
-                    if filename in self.include_file_at_specific_path:
-                        file_path = os.path.join(root, filename)
-                        matched_files.append(file_path)
-
-        # Regular scan with directory filtering
-        for dirpath, dirnames, filenames in os.walk(self.root_dir):
-            # Skip directories in the ignore list
-            dirnames[:] = [d for d in dirnames if d not in self.ignore_dirs]
-
-            for filename in filenames:
-                # Skip files with ignored filenames
-                if filename in self.ignore_filenames:
-                    continue
-
-                file_path = os.path.join(dirpath, filename)
-
-                # Compute the relative path and normalize it
-                rel_path = os.path.normpath(
-                    os.path.relpath(file_path, self.root_dir)
-                )
-
-                # If this relative path is in the ignore list, skip this file
-                if rel_path in normalized_ignore_paths:
-                    continue
-
-                # Check if file should be excluded based on extension
-                if any(
-                    filename.lower().endswith(ext.lower())
-                    for ext in self.ignore_exts
-                ):
-                    continue
-
-                # Include file if it meets either extension or name criteria
-                ext_match = any(
-                    filename.lower().endswith(ext.lower())
-                    for ext in self.accepted_exts
-                )
-                name_match = filename in self.include_file_at_specific_path
-
-                # If no filters are provided, include all files
-                include_all = not (
-                    self.accepted_exts or self.include_file_at_specific_path
-                )
-
-                if include_all or ext_match or name_match:
-                    # Don't add duplicates from the special scan
-                    if file_path not in matched_files:
-                        matched_files.append(file_path)
-
-        if matched_files == []:
-            return None
-        else:
-            return matched_files
+        # If no filters are provided, include all files
+        include_all = not (accepted_exts_lower or include_filenames)
+
+        # Single walk over the tree. Ignored directories are only descended
+        # into when there are specific filenames to pick up inside them.
+        for entry, in_ignored_dir in _walk(
+            root_dir, ignore_dirs, descend_ignored=bool(include_filenames)
+        ):
+            filename = entry.name
+            file_path = entry.path
+
+            # Specific filenames are included wherever they are, even in
+            # ignored directories and regardless of the other filters
+            if filename in include_filenames:
+                yield file_path
+                continue
+
+            if in_ignored_dir:
+                continue
+
+            # Skip files with ignored filenames
+            if filename in ignore_filenames:
+                continue
+
+            # Relative path of the file from root_dir
+            rel_path = file_path[root_prefix_len:]
+
+            # If this relative path is in the ignore list, skip this file
+            if rel_path in normalized_ignore_paths:
+                continue
+
+            filename_lower = filename.lower()
+
+            # Check if file should be excluded based on extension
+            if filename_lower.endswith(ignore_exts_lower):
+                continue
+
+            # Include file if it meets the extension criteria
+            if include_all or filename_lower.endswith(accepted_exts_lower):
+                yield file_path
 
 
 if __name__ == "__main__":
@@ -56,7 +56,7 @@ class TestRecursiveDirectoryFileScanner:
     def test_scan_default_params(self, setup_test_directory):
         """Test scanning with default parameters"""
         scanner = RecursiveDirectoryFileScanner(setup_test_directory)
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # Should find files but exclude __pycache__ directory
         assert len(results) > 0
@@ -69,7 +69,7 @@ class TestRecursiveDirectoryFileScanner:
             setup_test_directory,
             ignore_dirs=["dir1", "__pycache__", ".git"]
         )
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # Should not contain any files from dir1
         assert not any("dir1" in result for result in results)
@@ -81,7 +81,7 @@ class TestRecursiveDirectoryFileScanner:
             setup_test_directory,
             accepted_exts=[".py", ".js"]
         )
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # Should only include .py and .js files
         assert all(result.endswith((".py", ".js")) for result in results)
@@ -94,7 +94,7 @@ class TestRecursiveDirectoryFileScanner:
             setup_test_directory,
             ignore_exts=[".log", ".pyc"]
         )
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # Should not include .log or .pyc files
         assert not any(result.endswith(".log") for result in results)
@@ -106,7 +106,7 @@ class TestRecursiveDirectoryFileScanner:
         (setup_test_directory / "special.PDF").write_text("uppercase pdf")
 
         scanner = RecursiveDirectoryFileScanner(setup_test_directory)
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # Both lowercase and uppercase PDF files should be included
         pdf_files = [r for r in results if os.path.basename(r).lower().endswith(".pdf")]
@@ -122,18 +122,36 @@ class TestRecursiveDirectoryFileScanner:
             setup_test_directory,
             include_file_at_specific_path=["important.conf"]
         )
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # Should find the important.conf file even though it's in an ignored directory
         assert any("important.conf" in result for result in results)
 
+    def test_scan_include_specific_files_single_pass(self, setup_test_directory):
+        """Test that specific files are found once and ignored dirs stay filtered"""
+        (setup_test_directory / "__pycache__" / "nested").mkdir()
+        (setup_test_directory / "__pycache__" / "nested" / "file5.txt").write_text("nested")
+
+        scanner = RecursiveDirectoryFileScanner(
+            setup_test_directory,
+            accepted_exts=[".txt"],
+            include_file_at_specific_path=["file5.txt"]
+        )
+        results = list(scanner.scan())
+
+        # file5.txt matches both criteria but must only be reported once per path
+        assert len(results) == len(set(results))
+        assert sum(os.path.basename(r) == "file5.txt" for r in results) == 2
+        # Other files in ignored directories are still excluded
+        assert not any(r.endswith("file10.pyc") for r in results)
+
     def test_scan_with_ignore_filenames(self, setup_test_directory):
         """Test ignoring specific filenames"""
         scanner = RecursiveDirectoryFileScanner(
             setup_test_directory,
             ignore_filenames=["file1.txt", "file2.py"]
         )
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # These files should be excluded
         assert not any(result.endswith("file1.txt") for result in results)
@@ -148,7 +166,7 @@ class TestRecursiveDirectoryFileScanner:
             setup_test_directory,
             ignore_file_paths=[ignore_path]
         )
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # This specific path should be excluded
         assert not any(result.endswith(ignore_path) for result in results)
@@ -160,10 +178,18 @@ class TestRecursiveDirectoryFileScanner:
             setup_test_directory,
             accepted_exts=[".xyz"]  # Extension that doesn't exist
         )
+        results = list(scanner.scan())
+
+        # Should yield nothing when no files match
+        assert results == []
+
+    def test_scan_returns_iterator(self, setup_test_directory):
+        """Test that scan yields results lazily instead of building a list"""
+        scanner = RecursiveDirectoryFileScanner(setup_test_directory)
         results = scanner.scan()
 
-        # Should return None when no files match
-        assert results is None
+        assert not isinstance(results, list)
+        assert isinstance(next(results), str)
 
     def test_scan_combination_filters(self, setup_test_directory):
         """Test scanning with a combination of filters"""
@@ -173,7 +199,7 @@ class TestRecursiveDirectoryFileScanner:
             accepted_exts=[".py"],
             ignore_filenames=["file2.py"]
         )
-        results = scanner.scan()
+        results = list(scanner.scan())
 
         # Should only include .py files that are not file2.py and not in __pycache__
         assert all(result.endswith(".py") for result in results)